@@ -1,17 +1,70 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, HttpUrl
-from typing import Optional, Dict, Any
+from fastapi.responses import JSONResponse, Response
+from typing import Optional, Dict, Any, Tuple, Iterator
+from cachetools import TTLCache
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+import anyio
+import hashlib
+import asyncio
+import queue
 import yt_dlp
+from yt_dlp.utils import strftime_or_none
 import re
 import httpx
 import json
-from datetime import datetime
+import orjson
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for values orjson can't serialize natively (datetimes are handled by orjson itself)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson"""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+# yt-dlp extraction is blocking network I/O, so it runs in worker threads
+SCRAPE_THREAD_LIMIT = 64
+SCRAPE_TIMEOUT = 30.0
+
+# Scraped videos are cached by video ID for a short TTL
+VIDEO_CACHE_SIZE = 4096
+VIDEO_CACHE_TTL = 300
+
+# Lets CDNs and reverse proxies absorb repeat traffic for the same video
+VIDEO_CACHE_CONTROL = f"public, max-age={VIDEO_CACHE_TTL}, stale-while-revalidate=60"
+
+# Limits for POST /videos
+MAX_BATCH_SIZE = 50
+BATCH_CONCURRENCY = 16
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = SCRAPE_THREAD_LIMIT
+    yield
+    close_ydl_instances()
+
 
 app = FastAPI(
     title="YouTube Video Scraper API",
     description="Internal API to scrape YouTube video/shorts metadata",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -24,78 +77,107 @@ app.add_middleware(
 )
 
 
-class VideoRequest(BaseModel):
-    url: str
+# Compiled once at import; one alternation covers every supported URL format in a single scan
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com\/(?:watch\?v=|shorts\/|embed\/|v\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})')
+
+_PLAYER_RESPONSE_RE = re.compile(r'var ytInitialPlayerResponse\s*=\s*({.+?});')
+
 
+# Shortest possible match is "youtu.be/" plus an 11 char ID
+MIN_URL_LENGTH = 20
+MAX_URL_LENGTH = 2048
 
-class VideoResponse(BaseModel):
-    success: bool
-    data: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+# Recently rejected URLs, so repeated garbage input costs a single lookup
+_invalid_url_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
 
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from various YouTube URL formats"""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/shorts\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
+def require_video_id(url: str) -> str:
+    """Extract the video ID for a request URL, raising a 400 if there isn't one"""
+    if not MIN_URL_LENGTH <= len(url) <= MAX_URL_LENGTH or url in _invalid_url_cache:
+        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    video_id = extract_video_id(url)
+    if not video_id:
+        _invalid_url_cache[url] = True
+        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    return video_id
+
+
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """Convert seconds to ISO 8601 duration format (PT#H#M#S)"""
     if not seconds:
         return "PT0S"
     
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
     
-    duration = "PT"
+    parts = ["PT"]
     if hours:
-        duration += f"{hours}H"
+        parts.append(f"{hours}H")
     if minutes:
-        duration += f"{minutes}M"
-    if secs or (not hours and not minutes):
-        duration += f"{secs}S"
+        parts.append(f"{minutes}M")
+    if secs or not (hours or minutes):
+        parts.append(f"{secs}S")
     
-    return duration
+    return "".join(parts)
+
+
+_SHORTS_MARK = '/shorts/'
+
+
+def is_short_video(url: str, duration: Optional[int]) -> bool:
+    """A video is a short if requested via a /shorts/ URL or at most 60 seconds long"""
+    return _SHORTS_MARK in url or bool(duration and duration <= 60)
+
+
+# (size name, file name, width, height) for each thumbnail YouTube serves
+_THUMBNAIL_SIZES = (
+    ("default", "default.jpg", 120, 90),
+    ("medium", "mqdefault.jpg", 320, 180),
+    ("high", "hqdefault.jpg", 480, 360),
+    ("standard", "sddefault.jpg", 640, 480),
+    ("maxres", "maxresdefault.jpg", 1280, 720),
+)
+_THUMBNAIL_URL_PREFIX = "https://i.ytimg.com/vi/"
+WATCH_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+# Player embed HTML is only parameterized by the video ID
+_EMBED_PREFIX = '<iframe width="480" height="270" src="//www.youtube.com/embed/'
+_EMBED_SUFFIX = (
+    '" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; '
+    'gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" '
+    'allowfullscreen></iframe>'
+)
+_FALLBACK_EMBED_SUFFIX = '" frameborder="0" allowfullscreen></iframe>'
+
+# Response fields that are the same for every video; merged into each response.
+# Treat as read-only, the nested contentRating dict is shared.
+_STATIC_STATUS = {
+    "uploadStatus": "processed",
+    "license": "youtube",
+    "embeddable": True,
+    "publicStatsViewable": True
+}
+_STATIC_CONTENT_DETAILS = {
+    "dimension": "2d",
+    "licensedContent": True,
+    "contentRating": {},
+    "projection": "rectangular"
+}
 
 
 def get_thumbnail_urls(video_id: str) -> Dict[str, Dict[str, Any]]:
     """Generate thumbnail URLs for all sizes"""
+    base = _THUMBNAIL_URL_PREFIX + video_id + "/"
     return {
-        "default": {
-            "url": f"https://i.ytimg.com/vi/{video_id}/default.jpg",
-            "width": 120,
-            "height": 90
-        },
-        "medium": {
-            "url": f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg",
-            "width": 320,
-            "height": 180
-        },
-        "high": {
-            "url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
-            "width": 480,
-            "height": 360
-        },
-        "standard": {
-            "url": f"https://i.ytimg.com/vi/{video_id}/sddefault.jpg",
-            "width": 640,
-            "height": 480
-        },
-        "maxres": {
-            "url": f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
-            "width": 1280,
-            "height": 720
-        }
+        name: {"url": base + filename, "width": width, "height": height}
+        for name, filename, width, height in _THUMBNAIL_SIZES
     }
 
 
@@ -124,7 +206,7 @@ async def scrape_with_oembed_and_page(video_id: str, url: str) -> Dict[str, Any]
             if resp.status_code == 200:
                 html = resp.text
                 # Extract JSON data from page
-                match = re.search(r'var ytInitialPlayerResponse\s*=\s*({.+?});', html)
+                match = _PLAYER_RESPONSE_RE.search(html)
                 if match:
                     page_data = json.loads(match.group(1))
         except:
@@ -134,10 +216,10 @@ async def scrape_with_oembed_and_page(video_id: str, url: str) -> Dict[str, Any]
         video_details = page_data.get('videoDetails', {})
         microformat = page_data.get('microformat', {}).get('playerMicroformatRenderer', {})
         
-        is_short = '/shorts/' in url or (video_details.get('lengthSeconds') and int(video_details.get('lengthSeconds', 0)) <= 60)
-        
         duration_seconds = int(video_details.get('lengthSeconds', 0))
         
+        is_short = is_short_video(url, duration_seconds)
+        
         return {
             "videoId": video_id,
             "isShort": is_short,
@@ -166,25 +248,19 @@ async def scrape_with_oembed_and_page(video_id: str, url: str) -> Dict[str, Any]
                 "commentCount": "0"
             },
             "status": {
-                "uploadStatus": "processed",
+                **_STATIC_STATUS,
                 "privacyStatus": "public",
-                "license": "youtube",
-                "embeddable": True,
-                "publicStatsViewable": True,
                 "madeForKids": microformat.get('isFamilySafe', True)
             },
             "contentDetails": {
+                **_STATIC_CONTENT_DETAILS,
                 "duration": format_duration(duration_seconds),
                 "durationSeconds": duration_seconds,
-                "dimension": "2d",
                 "definition": "hd",
-                "caption": "false",
-                "licensedContent": True,
-                "contentRating": {},
-                "projection": "rectangular"
+                "caption": "false"
             },
             "player": {
-                "embedHtml": oembed_data.get('html', f'<iframe width="480" height="270" src="//www.youtube.com/embed/{video_id}" frameborder="0" allowfullscreen></iframe>')
+                "embedHtml": oembed_data['html'] if 'html' in oembed_data else _EMBED_PREFIX + video_id + _FALLBACK_EMBED_SUFFIX
             },
             "channel": {
                 "id": video_details.get('channelId', ''),
@@ -208,41 +284,104 @@ async def scrape_with_oembed_and_page(video_id: str, url: str) -> Dict[str, Any]
         }
 
 
+YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    # Only metadata is needed: one player client, no manifests or subtitle variants.
+    # visionos serves its formats without a PO token or JS player, so heights and
+    # audio languages are present even with the DASH/HLS manifests skipped.
+    'extractor_args': {'youtube': {
+        'player_client': ['visionos'],
+        'skip': ['dash', 'hls', 'translated_subs'],
+    }},
+    'writesubtitles': False,
+    'getcomments': False,
+    'http_headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept-Language': 'en-US,en;q=0.9',
+    },
+    'age_limit': None,
+    'geo_bypass': True,
+}
+
+# YoutubeDL instances are reused across requests to skip extractor setup and
+# keep HTTP connections alive. yt-dlp doesn't guarantee thread safety for a
+# shared instance, so each scrape borrows one from a pool and returns it.
+# At most SCRAPE_THREAD_LIMIT scrapes run at once, so that also bounds the pool.
+_ydl_pool: "queue.SimpleQueue[yt_dlp.YoutubeDL]" = queue.SimpleQueue()
+
+
+@contextmanager
+def get_ydl() -> Iterator[yt_dlp.YoutubeDL]:
+    """Borrow a pooled YoutubeDL instance, creating one if the pool is empty"""
+    try:
+        ydl = _ydl_pool.get_nowait()
+    except queue.Empty:
+        ydl = yt_dlp.YoutubeDL(YDL_OPTS)
+    try:
+        yield ydl
+    finally:
+        if _ydl_pool.qsize() < SCRAPE_THREAD_LIMIT:
+            _ydl_pool.put(ydl)
+        else:
+            ydl.close()
+
+
+def close_ydl_instances() -> None:
+    """Close every idle YoutubeDL instance in the pool"""
+    while True:
+        try:
+            ydl = _ydl_pool.get_nowait()
+        except queue.Empty:
+            return
+        ydl.close()
+
+
 def scrape_youtube_video(url: str) -> Dict[str, Any]:
     """Scrape YouTube video data using yt-dlp"""
     video_id = extract_video_id(url)
     if not video_id:
         raise ValueError("Invalid YouTube URL")
     
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
-        'skip_download': True,
-        'extractor_args': {'youtube': {'player_client': ['android_embedded', 'ios', 'web']}},
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        },
-        'age_limit': None,
-        'geo_bypass': True,
-    }
+    # process=False skips format selection and the rest of yt-dlp's post-processing,
+    # which also means redirects aren't followed. Extract from the canonical watch URL
+    # so playlist parameters etc. can't route the request to another extractor.
+    with get_ydl() as ydl:
+        info = ydl.extract_info(WATCH_URL_PREFIX + video_id, download=False, process=False)
+    if info.get('_type', 'video') != 'video':
+        raise ValueError(f"yt-dlp returned a {info.get('_type')!r} result instead of a video")
     
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+    # Fields used more than once are looked up once
+    title = info.get('title', '')
+    description = info.get('description', '')
+    duration = info.get('duration', 0)
+    channel_title = info.get('channel', '') or info.get('uploader', '')
+    availability = info.get('availability', None)
+    categories = info.get('categories')
     
     # Determine if it's a short
-    is_short = '/shorts/' in url or (info.get('duration', 0) and info.get('duration', 0) <= 60)
+    is_short = is_short_video(url, duration)
     
     # Format upload date
-    upload_date = info.get('upload_date', '')
-    if upload_date:
-        try:
-            formatted_date = datetime.strptime(upload_date, '%Y%m%d').strftime('%Y-%m-%dT%H:%M:%SZ')
-        except:
-            formatted_date = upload_date
+    upload_date = info.get('upload_date') or strftime_or_none(info.get('timestamp')) or ''
+    if len(upload_date) == 8 and upload_date.isdigit():
+        formatted_date = f"{upload_date[0:4]}-{upload_date[4:6]}-{upload_date[6:8]}T00:00:00Z"
     else:
-        formatted_date = None
+        formatted_date = upload_date or None
+    
+    # Processing used to copy the selected format's fields (height, language) onto
+    # info and derive is_live from live_status; without it they're taken here
+    formats = info.get('formats') or ()
+    height = max((f.get('height') or 0 for f in formats), default=0)
+    audio_format = max(
+        (f for f in formats if f.get('language')),
+        key=lambda f: f.get('language_preference') or -1,
+        default=None
+    )
+    language = audio_format['language'] if audio_format else None
+    is_live = info.get('live_status') == 'is_live'
     
     # Build channel URL
     channel_id = info.get('channel_id', '')
@@ -256,52 +395,46 @@ def scrape_youtube_video(url: str) -> Dict[str, Any]:
             "publishedAt": formatted_date,
             "channelId": channel_id,
             "channelUrl": channel_url,
-            "title": info.get('title', ''),
-            "description": info.get('description', ''),
+            "title": title,
+            "description": description,
             "thumbnails": get_thumbnail_urls(video_id),
-            "channelTitle": info.get('channel', '') or info.get('uploader', ''),
-            "categoryId": str(info.get('categories', [''])[0]) if info.get('categories') else None,
-            "liveBroadcastContent": "live" if info.get('is_live') else "none",
-            "defaultLanguage": info.get('language', None),
+            "channelTitle": channel_title,
+            "categoryId": str(categories[0]) if categories else None,
+            "liveBroadcastContent": "live" if is_live else "none",
+            "defaultLanguage": language,
             "localized": {
-                "title": info.get('title', ''),
-                "description": info.get('description', '')
+                "title": title,
+                "description": description
             },
-            "defaultAudioLanguage": info.get('language', None),
+            "defaultAudioLanguage": language,
             "tags": info.get('tags', [])
         },
         "statistics": {
-            "viewCount": str(info.get('view_count', 0) or 0),
-            "likeCount": str(info.get('like_count', 0) or 0),
+            "viewCount": str(info.get('view_count') or 0),
+            "likeCount": str(info.get('like_count') or 0),
             "favoriteCount": "0",
-            "commentCount": str(info.get('comment_count', 0) or 0)
+            "commentCount": str(info.get('comment_count') or 0)
         },
         "status": {
-            "uploadStatus": "processed",
-            "privacyStatus": "public" if info.get('availability') == 'public' else info.get('availability', 'public'),
-            "license": "youtube",
-            "embeddable": True,
-            "publicStatsViewable": True,
+            **_STATIC_STATUS,
+            "privacyStatus": availability or 'public',
             "madeForKids": info.get('is_age_restricted', False) == False
         },
         "contentDetails": {
-            "duration": format_duration(info.get('duration', 0)),
-            "durationSeconds": info.get('duration', 0),
-            "dimension": "2d",
-            "definition": "hd" if info.get('height', 0) >= 720 else "sd",
-            "caption": str(bool(info.get('subtitles') or info.get('automatic_captions'))).lower(),
-            "licensedContent": True,
-            "contentRating": {},
-            "projection": "rectangular"
+            **_STATIC_CONTENT_DETAILS,
+            "duration": format_duration(duration),
+            "durationSeconds": duration,
+            "definition": "hd" if height >= 720 else "sd",
+            "caption": str(bool(info.get('subtitles') or info.get('automatic_captions'))).lower()
         },
         "player": {
-            "embedHtml": f'<iframe width="480" height="270" src="//www.youtube.com/embed/{video_id}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" allowfullscreen></iframe>'
+            "embedHtml": _EMBED_PREFIX + video_id + _EMBED_SUFFIX
         },
         "channel": {
-            "id": info.get('channel_id', ''),
-            "title": info.get('channel', '') or info.get('uploader', ''),
+            "id": channel_id,
+            "title": channel_title,
             "customUrl": info.get('uploader_url', ''),
-            "subscriberCount": str(info.get('channel_follower_count', 0) or 0),
+            "subscriberCount": str(info.get('channel_follower_count') or 0),
             "thumbnails": {
                 "default": {
                     "url": info.get('channel_thumbnail', '') or '',
@@ -312,7 +445,7 @@ def scrape_youtube_video(url: str) -> Dict[str, Any]:
         },
         "additionalInfo": {
             "ageRestricted": info.get('age_limit', 0) > 0,
-            "availableCountries": info.get('availability', None),
+            "availableCountries": availability,
             "webpage_url": info.get('webpage_url', ''),
             "originalUrl": url
         }
@@ -321,72 +454,254 @@ def scrape_youtube_video(url: str) -> Dict[str, Any]:
     return response
 
 
+async def scrape_youtube_video_async(url: str) -> Dict[str, Any]:
+    """Run the blocking yt-dlp scraper in a worker thread, capped at SCRAPE_TIMEOUT"""
+    try:
+        return await asyncio.wait_for(
+            anyio.to_thread.run_sync(scrape_youtube_video, url),
+            timeout=SCRAPE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        # The bare TimeoutError has an empty message, which would surface as "Failed to scrape video: "
+        raise TimeoutError(f"yt-dlp timed out after {SCRAPE_TIMEOUT}s") from None
+
+
+# (data, pre-serialized {"success": true, "data": data} body, ETag of that body)
+CachedVideo = Tuple[Dict[str, Any], bytes, str]
+
+_video_cache: TTLCache = TTLCache(maxsize=VIDEO_CACHE_SIZE, ttl=VIDEO_CACHE_TTL)
+_video_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _make_entry(data: Dict[str, Any]) -> CachedVideo:
+    """Serialize a video response body once, along with its ETag"""
+    body = dump_json({"success": True, "data": data})
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    return data, body, etag
+
+
+async def _scrape_video(video_id: str) -> CachedVideo:
+    """Scrape with yt-dlp, falling back to oEmbed/page scraping. Only yt-dlp results are cached."""
+    # The entry serves every URL form of this video, so scrape the canonical one;
+    # _entry_for_url fills in the request URL's fields afterwards
+    url = WATCH_URL_PREFIX + video_id
+    try:
+        data = await scrape_youtube_video_async(url)
+    except Exception as e:
+        # Fallback to web scraping if yt-dlp fails
+        try:
+            data = await scrape_with_oembed_and_page(video_id, url)
+            return _make_entry(data)
+        except Exception as fallback_error:
+            raise HTTPException(status_code=500, detail=f"Failed to scrape video: {str(e)}")
+
+    entry = _make_entry(data)
+    _video_cache[video_id] = entry
+    return entry
+
+
+def _entry_for_url(entry: CachedVideo, url: str) -> CachedVideo:
+    """Adapt a cached entry to the URL of the current request"""
+    data = entry[0]
+    if data["additionalInfo"]["originalUrl"] == url:
+        return entry
+    data = {
+        **data,
+        "isShort": is_short_video(url, data["contentDetails"]["durationSeconds"]),
+        "additionalInfo": {**data["additionalInfo"], "originalUrl": url}
+    }
+    return _make_entry(data)
+
+
+async def fetch_video(video_id: str, url: str) -> CachedVideo:
+    """
+    Get video data from the cache or scrape it.
+
+    Concurrent misses for the same video ID share one in-flight scrape.
+    """
+    entry = _video_cache.get(video_id)
+    if entry is None:
+        task = _video_inflight.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(_scrape_video(video_id))
+            _video_inflight[video_id] = task
+            task.add_done_callback(lambda _: _video_inflight.pop(video_id, None))
+        # Shield so one client disconnecting doesn't cancel the scrape for the others
+        entry = await asyncio.shield(task)
+    return _entry_for_url(entry, url)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def video_body_response(request: Request, entry: CachedVideo) -> Response:
+    """
+    Send a video body with its ETag.
+
+    GET responses are also cacheable and answer a matching If-None-Match with a 304;
+    RFC 9110 only allows 304 for GET/HEAD, so other methods always get the body.
+    """
+    _, body, etag = entry
+    headers = {"ETag": etag}
+    if request.method in ("GET", "HEAD"):
+        headers["Cache-Control"] = VIDEO_CACHE_CONTROL
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Constant bodies are serialized once at import
+_ROOT_BODY = dump_json({
+    "message": "YouTube Video Scraper API",
+    "version": "1.0.0",
+    "endpoints": {
+        "GET /video": "Get video data by URL query parameter",
+        "POST /video": "Get video data by URL in request body",
+        "POST /videos": "Get data for multiple videos by URL list in request body",
+        "GET /health": "Health check endpoint"
+    }
+})
+_HEALTH_BODY = dump_json({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API info"""
-    return {
-        "message": "YouTube Video Scraper API",
-        "version": "1.0.0",
-        "endpoints": {
-            "GET /video": "Get video data by URL query parameter",
-            "POST /video": "Get video data by URL in request body",
-            "GET /health": "Health check endpoint"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/video", response_model=VideoResponse)
-async def get_video_by_query(url: str = Query(..., description="YouTube video or shorts URL")):
+@app.get("/video")
+async def get_video_by_query(request: Request, url: str = Query(..., description="YouTube video or shorts URL")):
     """
     Get YouTube video metadata by URL query parameter
     
     Example: /video?url=https://www.youtube.com/watch?v=VIDEO_ID
     """
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    video_id = require_video_id(url)
     
+    entry = await fetch_video(video_id, url)
+    return video_body_response(request, entry)
+
+
+# The body is parsed by hand rather than through a Pydantic model, so document it here
+_VIDEO_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "required": ["url"],
+                "properties": {"url": {"type": "string", "description": "YouTube video or shorts URL"}}
+            }
+        }
+    }
+}
+
+
+async def read_json_body(request: Request) -> Dict[str, Any]:
+    """Parse the request body as a JSON object, raising a 400 if it isn't one"""
     try:
-        data = scrape_youtube_video(url)
-        return VideoResponse(success=True, data=data)
-    except Exception as e:
-        # Fallback to web scraping if yt-dlp fails
-        try:
-            data = await scrape_with_oembed_and_page(video_id, url)
-            return VideoResponse(success=True, data=data)
-        except Exception as fallback_error:
-            raise HTTPException(status_code=500, detail=f"Failed to scrape video: {str(e)}")
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return payload
 
 
-@app.post("/video", response_model=VideoResponse)
-async def get_video_by_body(request: VideoRequest):
+@app.post("/video", openapi_extra={"requestBody": _VIDEO_REQUEST_BODY})
+async def get_video_by_body(request: Request):
     """
     Get YouTube video metadata by URL in request body
     
     Request body: {"url": "https://www.youtube.com/watch?v=VIDEO_ID"}
     """
-    video_id = extract_video_id(request.url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    url = (await read_json_body(request)).get("url")
+    if not isinstance(url, str):
+        raise HTTPException(status_code=400, detail="Missing 'url' in request body")
+    
+    video_id = require_video_id(url)
     
+    entry = await fetch_video(video_id, url)
+    return video_body_response(request, entry)
+
+
+_VIDEOS_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "required": ["urls"],
+                "properties": {
+                    "urls": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "maxItems": MAX_BATCH_SIZE,
+                        "description": "YouTube video or shorts URLs"
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+async def _fetch_batch_item(url: Any, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """Fetch one URL of a batch, reporting failure in the item instead of raising"""
     try:
-        data = scrape_youtube_video(request.url)
-        return VideoResponse(success=True, data=data)
+        if not isinstance(url, str):
+            raise HTTPException(status_code=400, detail="URL must be a string")
+        video_id = require_video_id(url)
+        async with semaphore:
+            data = (await fetch_video(video_id, url))[0]
+        return {"url": url, "success": True, "data": data}
+    except HTTPException as e:
+        return {"url": url, "success": False, "error": e.detail}
     except Exception as e:
-        # Fallback to web scraping if yt-dlp fails
-        try:
-            data = await scrape_with_oembed_and_page(video_id, request.url)
-            return VideoResponse(success=True, data=data)
-        except Exception as fallback_error:
-            raise HTTPException(status_code=500, detail=f"Failed to scrape video: {str(e)}")
+        return {"url": url, "success": False, "error": f"Failed to scrape video: {str(e)}"}
+
+
+@app.post("/videos", openapi_extra={"requestBody": _VIDEOS_REQUEST_BODY})
+async def get_videos_by_body(request: Request):
+    """
+    Get YouTube video metadata for several URLs at once
+    
+    Request body: {"urls": ["https://www.youtube.com/watch?v=VIDEO_ID", ...]}
+    
+    Videos are scraped concurrently; each result has its own success flag and error.
+    """
+    urls = (await read_json_body(request)).get("urls")
+    if not isinstance(urls, list):
+        raise HTTPException(status_code=400, detail="Missing 'urls' list in request body")
+    if len(urls) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} URLs per request")
+    
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(_fetch_batch_item(url, semaphore) for url in urls))
+    return ORJSONResponse({"success": True, "results": results})
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http stay on "auto": uvicorn picks uvloop and httptools when installed.
+    # Each worker process keeps its own video cache.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count() or 1,
+        access_log=False
+    )
@@ -0,0 +1,67 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+VIDEO_ID = "dQw4w9WgXcQ"
+WATCH_URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+SHORTS_URL = f"https://www.youtube.com/shorts/{VIDEO_ID}"
+
+
+class FakeYoutubeDL:
+    """Stands in for yt_dlp.YoutubeDL, returning a fixed info dict"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+        self.info = {
+            "title": "Title",
+            "description": "Description",
+            "channel_id": "UC123",
+            "channel": "Channel",
+            "duration": 212,
+            "view_count": 100,
+            "timestamp": 1212060266,
+            "live_status": "not_live",
+            "availability": "public",
+            "formats": [{"height": 1080}],
+        }
+
+    def extract_info(self, url, download=False, process=True):
+        with self.lock:
+            self.calls.append(url)
+        time.sleep(self.delay)
+        video_id = main.extract_video_id(url)
+        if video_id.startswith("fail"):
+            raise RuntimeError("extraction failed")
+        return {"id": video_id, **self.info}
+
+
+@pytest.fixture
+def ydl(monkeypatch):
+    fake = FakeYoutubeDL()
+
+    @contextmanager
+    def get_ydl():
+        yield fake
+
+    async def no_fallback(video_id, url):
+        raise RuntimeError("fallback disabled")
+
+    monkeypatch.setattr(main, "get_ydl", get_ydl)
+    monkeypatch.setattr(main, "scrape_with_oembed_and_page", no_fallback)
+    main._video_cache.clear()
+    main._invalid_url_cache.clear()
+    main._video_inflight.clear()
+    return fake
+
+
+@pytest.fixture
+def client(ydl):
+    with TestClient(main.app) as client:
+        yield client
@@ -0,0 +1,19 @@
+import app.main as main
+from tests.conftest import VIDEO_ID, WATCH_URL
+
+
+def test_batch_reports_each_item(client):
+    urls = [WATCH_URL, 42, "https://example.com/not-a-video", "https://youtu.be/failfailfai"]
+    resp = client.post("/videos", json={"urls": urls})
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [item["success"] for item in results] == [True, False, False, False]
+    assert results[0]["data"]["videoId"] == VIDEO_ID
+    assert results[1]["error"] == "URL must be a string"
+    assert results[2]["error"] == "Invalid YouTube URL"
+    assert results[3]["error"].startswith("Failed to scrape video")
+
+
+def test_batch_size_limit(client):
+    resp = client.post("/videos", json={"urls": [WATCH_URL] * (main.MAX_BATCH_SIZE + 1)})
+    assert resp.status_code == 400
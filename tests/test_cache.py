@@ -0,0 +1,38 @@
+import asyncio
+
+import app.main as main
+from tests.conftest import VIDEO_ID, WATCH_URL, SHORTS_URL
+
+
+def test_cache_hit_for_other_url_updates_url_fields(client, ydl):
+    first = client.get("/video", params={"url": WATCH_URL}).json()["data"]
+    assert first["isShort"] is False
+    assert first["additionalInfo"]["originalUrl"] == WATCH_URL
+
+    second = client.post("/video", json={"url": SHORTS_URL}).json()["data"]
+    assert second["isShort"] is True
+    assert second["additionalInfo"]["originalUrl"] == SHORTS_URL
+    assert len(ydl.calls) == 1
+
+
+def test_concurrent_misses_share_one_scrape(ydl):
+    ydl.delay = 0.2
+
+    async def fetch_many():
+        return await asyncio.gather(*(main.fetch_video(VIDEO_ID, WATCH_URL) for _ in range(5)))
+
+    results = asyncio.run(fetch_many())
+    assert len(ydl.calls) == 1
+    assert all(data["videoId"] == VIDEO_ID for data, *_ in results)
+
+
+def test_cache_entry_is_scraped_from_canonical_url(client, ydl):
+    playlist_url = WATCH_URL + "&list=PL0123456789"
+    client.get("/video", params={"url": playlist_url})
+
+    data = main._video_cache[VIDEO_ID][0]
+    assert data["additionalInfo"]["originalUrl"] == WATCH_URL
+
+    other = client.get("/video", params={"url": SHORTS_URL}).json()["data"]
+    assert other["additionalInfo"]["originalUrl"] == SHORTS_URL
+    assert ydl.calls == [WATCH_URL]
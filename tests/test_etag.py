@@ -0,0 +1,36 @@
+import pytest
+
+import app.main as main
+from tests.conftest import VIDEO_ID, WATCH_URL
+
+
+@pytest.mark.parametrize("header", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_matching_etag_returns_304(client, header):
+    first = client.get("/video", params={"url": WATCH_URL})
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public")
+
+    resp = client.get("/video", params={"url": WATCH_URL}, headers={"If-None-Match": header.format(etag=etag)})
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+
+
+def test_stale_etag_returns_body(client):
+    resp = client.get("/video", params={"url": WATCH_URL}, headers={"If-None-Match": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["videoId"] == VIDEO_ID
+
+
+def test_post_ignores_if_none_match(client):
+    first = client.get("/video", params={"url": WATCH_URL})
+    etag = first.headers["etag"]
+
+    resp = client.post("/video", json={"url": WATCH_URL}, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] == etag
+    assert "cache-control" not in resp.headers
+
+
+def test_etag_is_stored_with_cache_entry(client):
+    first = client.get("/video", params={"url": WATCH_URL})
+    assert main._video_cache[VIDEO_ID][2] == first.headers["etag"]
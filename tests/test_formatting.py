@@ -0,0 +1,19 @@
+import pytest
+
+import app.main as main
+
+
+@pytest.mark.parametrize("seconds, expected", [
+    (0, "PT0S"),
+    (None, "PT0S"),
+    (5, "PT5S"),
+    (60, "PT1M"),
+    (61, "PT1M1S"),
+    (3600, "PT1H"),
+    (3601, "PT1H1S"),
+    (3660, "PT1H1M"),
+    (3661, "PT1H1M1S"),
+    (90061, "PT25H1M1S"),
+])
+def test_format_duration(seconds, expected):
+    assert main.format_duration(seconds) == expected
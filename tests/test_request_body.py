@@ -0,0 +1,22 @@
+import pytest
+
+from tests.conftest import VIDEO_ID, WATCH_URL
+
+
+def test_post_video_reads_url_from_body(client):
+    resp = client.post("/video", json={"url": WATCH_URL})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["videoId"] == VIDEO_ID
+
+
+@pytest.mark.parametrize("kwargs, detail", [
+    ({"content": b"{not json"}, "Request body must be valid JSON"),
+    ({"json": [WATCH_URL]}, "Request body must be a JSON object"),
+    ({"json": {}}, "Missing 'url' in request body"),
+    ({"json": {"url": 42}}, "Missing 'url' in request body"),
+    ({"json": {"url": "https://example.com/not-a-video"}}, "Invalid YouTube URL"),
+])
+def test_post_video_rejects_bad_bodies(client, kwargs, detail):
+    resp = client.post("/video", **kwargs)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == detail
@@ -0,0 +1,80 @@
+import pytest
+
+import app.main as main
+from tests.conftest import VIDEO_ID, WATCH_URL
+
+
+def test_extracts_from_canonical_watch_url(ydl):
+    url = f"https://www.youtube.com/watch?v={VIDEO_ID}&list=PL0123456789"
+    data = main.scrape_youtube_video(url)
+    assert ydl.calls == [WATCH_URL]
+    assert data["additionalInfo"]["originalUrl"] == url
+
+
+def test_non_video_result_is_rejected(client, ydl):
+    ydl.info["_type"] = "url"
+    with pytest.raises(ValueError):
+        main.scrape_youtube_video(WATCH_URL)
+
+    resp = client.get("/video", params={"url": WATCH_URL})
+    assert resp.status_code == 500
+    assert VIDEO_ID not in main._video_cache
+
+
+def test_published_at_is_filled_from_timestamp(ydl):
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["snippet"]["publishedAt"] == "2008-05-29T00:00:00Z"
+
+
+def test_upload_date_is_preferred_over_timestamp(ydl):
+    ydl.info["upload_date"] = "20240102"
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["snippet"]["publishedAt"] == "2024-01-02T00:00:00Z"
+
+
+@pytest.mark.parametrize("live_status, expected", [
+    ("is_live", "live"),
+    ("not_live", "none"),
+    ("was_live", "none"),
+    (None, "none"),
+])
+def test_live_broadcast_content_from_live_status(ydl, live_status, expected):
+    ydl.info["live_status"] = live_status
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["snippet"]["liveBroadcastContent"] == expected
+
+
+@pytest.mark.parametrize("formats, expected", [
+    ([{"height": 360}, {"height": 1080}, {}], "hd"),
+    ([{"height": 360}, {"height": 480}], "sd"),
+    ([], "sd"),
+])
+def test_definition_from_tallest_format(ydl, formats, expected):
+    ydl.info["formats"] = formats
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["contentDetails"]["definition"] == expected
+
+
+def test_language_from_preferred_audio_format(ydl):
+    ydl.info["formats"] = [
+        {"height": 720},
+        {"language": "de", "language_preference": -1},
+        {"language": "en", "language_preference": 10},
+        {"language": "fr"},
+    ]
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["snippet"]["defaultLanguage"] == "en"
+    assert data["snippet"]["defaultAudioLanguage"] == "en"
+
+
+def test_language_is_none_without_audio_languages(ydl):
+    data = main.scrape_youtube_video(WATCH_URL)
+    assert data["snippet"]["defaultLanguage"] is None
+
+
+def test_timeout_reports_reason(client, ydl, monkeypatch):
+    monkeypatch.setattr(main, "SCRAPE_TIMEOUT", 0.05)
+    ydl.delay = 0.3
+    resp = client.get("/video", params={"url": WATCH_URL})
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == "Failed to scrape video: yt-dlp timed out after 0.05s"
@@ -0,0 +1,56 @@
+import pytest
+
+import app.main as main
+from tests.conftest import VIDEO_ID, WATCH_URL
+
+
+def test_require_video_id_rejects_and_remembers_bad_urls():
+    main._invalid_url_cache.clear()
+    assert main.require_video_id(WATCH_URL) == VIDEO_ID
+    with pytest.raises(main.HTTPException):
+        main.require_video_id("too short")
+    with pytest.raises(main.HTTPException):
+        main.require_video_id("https://example.com/not-a-video")
+    assert "https://example.com/not-a-video" in main._invalid_url_cache
+
+
+def test_negative_cache_skips_regex(monkeypatch):
+    main._invalid_url_cache.clear()
+    bad_url = "https://example.com/not-a-video"
+    with pytest.raises(main.HTTPException):
+        main.require_video_id(bad_url)
+
+    def fail(url):
+        raise AssertionError("regex ran for a cached invalid URL")
+
+    monkeypatch.setattr(main, "extract_video_id", fail)
+    with pytest.raises(main.HTTPException) as excinfo:
+        main.require_video_id(bad_url)
+    assert excinfo.value.status_code == 400
+
+
+def test_overlong_url_is_rejected():
+    with pytest.raises(main.HTTPException):
+        main.require_video_id(WATCH_URL + "&x=" + "a" * main.MAX_URL_LENGTH)
+
+
+@pytest.mark.parametrize("url", [
+    f"https://www.youtube.com/watch?v={VIDEO_ID}",
+    f"https://m.youtube.com/watch?v={VIDEO_ID}&t=42",
+    f"https://youtu.be/{VIDEO_ID}?si=abc",
+    f"https://www.youtube.com/shorts/{VIDEO_ID}",
+    f"https://www.youtube.com/embed/{VIDEO_ID}",
+    f"https://www.youtube.com/v/{VIDEO_ID}",
+])
+def test_extract_video_id_supported_formats(url):
+    assert main.extract_video_id(url) == VIDEO_ID
+
+
+@pytest.mark.parametrize("url", [
+    f"https://example.com/watch?v={VIDEO_ID}",
+    f"https://example.com/embed/{VIDEO_ID}",
+    "https://www.youtube.com/watch?v=short",
+    "https://www.youtube.com/channel/UC123",
+])
+def test_extract_video_id_rejects_other_urls(url):
+    assert main.extract_video_id(url) is None